@@ -8,22 +8,95 @@ Key convention (important!):
 So response_time is a RESOURCE everywhere (it gets minimized / bounded above in queries).
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
 import random
 
+import numpy as np
+
+# Values are drawn from the stdlib stream (in the original per-row order) so the
+# committed catalogues stay reproducible; numpy only does the arithmetic.
 random.seed(7)
 
 ROOT = Path("wildfire.mcdplib/catalogues")
 ROOT.mkdir(parents=True, exist_ok=True)
 
 
-def write_yaml(path: Path, text: str):
-    path.write_text(text.strip() + "\n", encoding="utf-8")
+def write_yaml(path: Path, header: str, body_iter: Iterable[str]):
+    with path.open("w", encoding="utf-8", buffering=1 << 16) as f:
+        f.write(header)
+        for frag in body_iter:
+            f.write(frag)
     print(f"Wrote {path}")
 
 
-def gen_aircraft(n: int = 100) -> str:
-    """Aircraft catalogue.
+AIRCRAFT_HEADER = """# Catalogue of aircraft options
+F: [ha]
+R:
+  - USD
+  - kg
+  - min
+
+implementations:
+"""
+
+AIRCRAFT_TEMPLATE = (
+    "  model{k}:\n"
+    "    f_max:\n"
+    "      - \"{a} ha\"\n"
+    "    r_min:\n"
+    "      - \"{c} USD\"\n"
+    "      - \"{l} kg\"\n"
+    "      - \"{t} min\"\n"
+)
+
+CREWS_HEADER = """# Catalogue of ground crew options
+F: [ha]
+R:
+  - USD
+  - min
+
+implementations:
+"""
+
+CREWS_TEMPLATE = (
+    "  model{k}:\n"
+    "    f_max:\n"
+    "      - \"{a} ha\"\n"
+    "    r_min:\n"
+    "      - \"{c} USD\"\n"
+    "      - \"{t} min\"\n"
+)
+
+RETARDANT_HEADER = """# Catalogue of retardant/supply options
+F: [kg]
+R: [USD]
+
+implementations:
+"""
+
+RETARDANT_TEMPLATE = (
+    "  model{k}:\n"
+    "    f_max:\n"
+    "      - \"{l} kg\"\n"
+    "    r_min:\n"
+    "      - \"{c} USD\"\n"
+)
+
+
+def _emit_rows(template: str, **columns) -> Iterator[str]:
+    """Format one template per row; `columns` maps template fields to equal-length arrays."""
+    keys = list(columns)
+    row = {}  # reused across rows
+    for k, values in enumerate(zip(*(col.tolist() for col in columns.values()))):
+        row["k"] = k
+        row.update(zip(keys, values))
+        yield template.format_map(row)
+
+
+def gen_aircraft(n: int = 100) -> Iterator[str]:
+    """Aircraft catalogue rows (YAML fragments under AIRCRAFT_HEADER).
 
     F:  [ha]
     R:  [USD, kg, min]
@@ -31,64 +104,41 @@ def gen_aircraft(n: int = 100) -> str:
     area_bins = [10, 15, 20, 25, 30, 35, 40, 45, 50]
     time_bins = [6, 8, 10, 12, 15, 18, 22, 26, 30]
 
-    rows = []
-    for _ in range(n):
-        area = random.choice(area_bins)
-        time = random.choice(time_bins)
-
-        # Simple synthetic relationship:
-        # - more area => higher cost & load
-        # - faster (smaller time) => higher cost & load
-        cost = (
-            150_000
-            + area * 25_000
-            + max(0, 22 - time) * 40_000
-            + random.randint(-25_000, 25_000)
-        )
-        load = (
-            1200
-            + area * 55
-            + max(0, 22 - time) * 95
-            + random.randint(-200, 200)
+    draws = [
+        (
+            random.choice(area_bins),
+            random.choice(time_bins),
+            random.randint(-25_000, 25_000),
+            random.randint(-200, 200),
         )
-
-        cost = max(int(cost), 120_000)
-        load = max(int(load), 500)
-        rows.append((area, cost, load, time))
-
-    # A couple anchors (helps shape the front)
-    rows += [
-        (10, 250_000, 1500, 30),   # slow/cheap-ish
-        (50, 2_000_000, 7000, 6),  # fast/expensive/heavy
+        for _ in range(n)
     ]
+    areas, times, cost_noise, load_noise = np.array(draws, dtype=np.int64).reshape(n, 4).T
 
-    impl = []
-    for k, (a, c, l, t) in enumerate(rows):
-        impl.append(
-            f"""  model{k}:
-    f_max:
-      - \"{a} ha\"
-    r_min:
-      - \"{c} USD\"
-      - \"{l} kg\"
-      - \"{t} min\"
-"""
-        )
+    # Simple synthetic relationship:
+    # - more area => higher cost & load
+    # - faster (smaller time) => higher cost & load
+    speedup = np.maximum(0, 22 - times)
+    costs = 150_000 + areas * 25_000 + speedup * 40_000 + cost_noise
+    loads = 1200 + areas * 55 + speedup * 95 + load_noise
 
-    return f"""# Catalogue of aircraft options
-F: [ha]
-R:
-  - USD
-  - kg
-  - min
+    costs = np.maximum(costs, 120_000).astype(np.int64)
+    loads = np.maximum(loads, 500).astype(np.int64)
 
-implementations:
-{''.join(impl)}
-"""
+    # A couple anchors (helps shape the front):
+    # slow/cheap-ish, then fast/expensive/heavy
+    areas = np.append(areas, [10, 50])
+    costs = np.append(costs, [250_000, 2_000_000])
+    loads = np.append(loads, [1500, 7000])
+    times = np.append(times, [30, 6])
 
+    # Rows are drawn eagerly (above) so the shared stream is consumed in call order;
+    # only the formatting is deferred to the writer.
+    return _emit_rows(AIRCRAFT_TEMPLATE, a=areas, c=costs, l=loads, t=times)
 
-def gen_crews(n: int = 100) -> str:
-    """Ground crews catalogue.
+
+def gen_crews(n: int = 100) -> Iterator[str]:
+    """Ground crews catalogue rows (YAML fragments under CREWS_HEADER).
 
     F: [ha]
     R: [USD, min]
@@ -96,86 +146,49 @@ def gen_crews(n: int = 100) -> str:
     area_bins = [20, 30, 40, 50, 60, 70, 80, 90, 100, 110, 120]
     time_bins = [10, 15, 18, 20, 25, 30, 35, 40, 45, 60]
 
-    rows = []
-    for _ in range(n):
-        area = random.choice(area_bins)
-        time = random.choice(time_bins)
-
-        cost = (
-            80_000
-            + area * 6_500
-            + max(0, 45 - time) * 8_000
-            + random.randint(-12_000, 12_000)
-        )
-        cost = max(int(cost), 60_000)
-        rows.append((area, cost, time))
-
-    rows += [
-        (20, 150_000, 60),
-        (120, 1_050_000, 10),
+    draws = [
+        (random.choice(area_bins), random.choice(time_bins), random.randint(-12_000, 12_000))
+        for _ in range(n)
     ]
+    areas, times, cost_noise = np.array(draws, dtype=np.int64).reshape(n, 3).T
 
-    impl = []
-    for k, (a, c, t) in enumerate(rows):
-        impl.append(
-            f"""  model{k}:
-    f_max:
-      - \"{a} ha\"
-    r_min:
-      - \"{c} USD\"
-      - \"{t} min\"
-"""
-        )
+    costs = 80_000 + areas * 6_500 + np.maximum(0, 45 - times) * 8_000 + cost_noise
+    costs = np.maximum(costs, 60_000).astype(np.int64)
 
-    return f"""# Catalogue of ground crew options
-F: [ha]
-R:
-  - USD
-  - min
+    areas = np.append(areas, [20, 120])
+    costs = np.append(costs, [150_000, 1_050_000])
+    times = np.append(times, [60, 10])
 
-implementations:
-{''.join(impl)}
-"""
+    return _emit_rows(CREWS_TEMPLATE, a=areas, c=costs, t=times)
 
 
-def gen_retardant(n: int = 40) -> str:
-    """Retardant/supply catalogue.
+def gen_retardant(n: int = 40) -> Iterator[str]:
+    """Retardant/supply catalogue rows (YAML fragments under RETARDANT_HEADER).
 
     F: [kg]
     R: [USD]
     """
     load_bins = [1000, 1500, 2000, 2500, 3000, 4000, 5000, 6000, 7000]
 
-    rows = []
-    for _ in range(n):
-        load = random.choice(load_bins)
-        cost = 20_000 + load * 18 + random.randint(-3_000, 3_000)
-        cost = max(int(cost), 10_000)
-        rows.append((load, cost))
-
-    rows += [(2000, 50_000), (6000, 50_000)]
-
-    impl = []
-    for k, (l, c) in enumerate(rows):
-        impl.append(
-            f"""  model{k}:
-    f_max:
-      - \"{l} kg\"
-    r_min:
-      - \"{c} USD\"
-"""
-        )
+    draws = [(random.choice(load_bins), random.randint(-3_000, 3_000)) for _ in range(n)]
+    loads, cost_noise = np.array(draws, dtype=np.int64).reshape(n, 2).T
 
-    return f"""# Catalogue of retardant/supply options
-F: [kg]
-R: [USD]
+    costs = 20_000 + loads * 18 + cost_noise
+    costs = np.maximum(costs, 10_000).astype(np.int64)
 
-implementations:
-{''.join(impl)}
-"""
+    loads = np.append(loads, [2000, 6000])
+    costs = np.append(costs, [50_000, 50_000])
+
+    return _emit_rows(RETARDANT_TEMPLATE, l=loads, c=costs)
 
 
 if __name__ == "__main__":
-    write_yaml(ROOT / "aircraft_catalogue.yaml", gen_aircraft(100))
-    write_yaml(ROOT / "crews_catalogue.yaml", gen_crews(100))
-    write_yaml(ROOT / "retardant_catalogue.yaml", gen_retardant(40))
+    # Generate sequentially (deterministic random draws), write the files concurrently
+    jobs = [
+        (ROOT / "aircraft_catalogue.yaml", AIRCRAFT_HEADER, gen_aircraft(100)),
+        (ROOT / "crews_catalogue.yaml", CREWS_HEADER, gen_crews(100)),
+        (ROOT / "retardant_catalogue.yaml", RETARDANT_HEADER, gen_retardant(40)),
+    ]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        for fut in [pool.submit(write_yaml, *job) for job in jobs]:
+            fut.result()
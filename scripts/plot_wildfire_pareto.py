@@ -24,76 +24,232 @@ Note: In 3D, “dominated region” is not well-defined in 2D without either pro
 from __future__ import annotations
 
 import argparse
-from decimal import Decimal
-from typing import List, Sequence, Tuple
+import functools
+import re
+from typing import Optional, Sequence
 
-import matplotlib.pyplot as plt
-import yaml
+import numpy as np
+
+# matplotlib, yaml and numba are imported lazily where needed, so that
+# `--help` and argument errors don't pay for them.
+
+_DECIMAL_RE = re.compile(r"Decimal\('([^']+)'\)")
+_TUPLE_RE = re.compile(r"\(([^()]*)\)")
+_MINIMALS_RE = re.compile(r"^([ \t]+)minimals:[ \t]*(.*)$", re.M)
+
+
+def _parse_minimals(raw: str) -> np.ndarray:
+    """
+    Parse the `minimals` antichain literal written by mcdp-solve-query, e.g.
+    "frozenset({(Decimal('1'), Decimal('2'), Decimal('3')), ...})",
+    into an (N, 3) float array of (cost, load, time) rows.
+
+    Points without a time coordinate get time = 0.0.
+    """
+    # Unwrap Decimal('x') -> x so that only the tuple parentheses remain
+    flat = _DECIMAL_RE.sub(r"\1", raw)
+    bodies = [b for b in _TUPLE_RE.findall(flat) if b.strip()]
+    if not bodies:
+        return np.zeros((0, 3), dtype=np.float64)
+
+    # All tuples share one arity, so convert every number in a single pass and reshape
+    vals = np.fromiter(map(float, ",".join(bodies).split(",")), dtype=np.float64)
+    arr = vals.reshape(len(bodies), -1)[:, :3]
+    if arr.shape[1] < 3:
+        arr = np.pad(arr, ((0, 0), (0, 3 - arr.shape[1])))
+    return arr
+
+
+def _extract_minimals(text: str, which: str) -> Optional[str]:
+    """
+    Pull the `minimals` scalar of the `which:` section straight out of the raw
+    output.yaml text, skipping the YAML parser.
+
+    Only handles the plain single-line scalar that mcdp-solve-query writes;
+    returns None for anything else (quoted/block scalars, continuation lines, ...)
+    so the caller can fall back to a full YAML load.
+    """
+    section = re.search(rf"^{re.escape(which)}:[ \t]*$", text, re.M)
+    if section is None:
+        return None
+    m = _MINIMALS_RE.search(text, section.end())
+    if m is None:
+        return None
+
+    # Must belong to this section, i.e. no other top-level key in between
+    if re.search(r"^\S", text[section.end() : m.start()], re.M):
+        return None
+
+    indent, value = m.group(1), m.group(2).strip()
+    if not value or value[0] in "'\"|>&*!":
+        return None
+
+    # A more-indented next line would be a continuation of a multi-line plain scalar
+    rest = text[m.end() + 1 :]
+    next_line = rest.split("\n", 1)[0]
+    if next_line.strip() and len(next_line) - len(next_line.lstrip()) > len(indent):
+        return None
+    return value
 
 
 def load_antichain(path: str = "out-query/output.yaml", which: str = "optimistic"):
+    """
+    Load the antichain as (loads, costs, times) arrays, sorted by load, then cost, then time.
+    """
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        text = f.read()
 
-    raw = data[which]["minimals"]
-    antichain = eval(raw, {"Decimal": Decimal, "frozenset": frozenset}, {})
+    raw = _extract_minimals(text, which)
+    if raw is None:
+        import yaml
 
-    pts = list(antichain)
-    if not pts:
-        return [], [], []
+        try:
+            from yaml import CSafeLoader as Loader  # libyaml-backed
+        except ImportError:
+            from yaml import SafeLoader as Loader
 
-    # Expect tuples like (cost, load, time)
-    pts.sort(key=lambda p: (float(p[1]), float(p[0]), float(p[2]) if len(p) > 2 else 0.0))
+        raw = yaml.load(text, Loader=Loader)[which]["minimals"]
 
-    loads = [float(p[1]) for p in pts]
-    costs = [float(p[0]) for p in pts]
-    times = [float(p[2]) for p in pts] if len(pts[0]) >= 3 else [0.0 for _ in pts]
-    return loads, costs, times
+    arr = _parse_minimals(raw)
+    if not len(arr):
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty, empty
 
+    # Rows are (cost, load, time); sort by load, then cost, then time (lexsort: primary key last)
+    arr = arr[np.lexsort((arr[:, 2], arr[:, 0], arr[:, 1]))]
+    return arr[:, 1], arr[:, 0], arr[:, 2]
 
-def pareto_2d_min(loads: Sequence[float], costs: Sequence[float]) -> List[int]:
+
+def _bnl_2d(loads: np.ndarray, costs: np.ndarray) -> np.ndarray:
     """
-    Compute indices of the 2D Pareto frontier for minimization in (load, cost).
-    Returns indices of nondominated points.
+    Block-nested-loop skyline for 2D minimization: one unsorted pass, comparing
+    each point against the current (small) window of nondominated points.
+    Returns frontier indices in discovery order.
+    """
+    n = loads.shape[0]
+    fl = np.empty(n, np.float64)
+    fc = np.empty(n, np.float64)
+    fi = np.empty(n, np.int64)
+    m = 0
+    for i in range(n):
+        li, ci = loads[i], costs[i]
+        dominated = False
+        j = 0
+        while j < m:
+            # Weak dominance here, so exact duplicates keep only their first occurrence
+            if fl[j] <= li and fc[j] <= ci:
+                dominated = True
+                break
+            if li <= fl[j] and ci <= fc[j]:
+                fl[j] = fl[m - 1]
+                fc[j] = fc[m - 1]
+                fi[j] = fi[m - 1]
+                m -= 1
+            else:
+                j += 1
+        if not dominated:
+            fl[m] = li
+            fc[m] = ci
+            fi[m] = i
+            m += 1
+    return fi[:m].copy()
+
+
+@functools.lru_cache(maxsize=None)
+def _bnl_2d_jit():
+    """The numba-compiled BNL kernel, or None if numba isn't installed."""
+    try:
+        from numba import njit
+    except ImportError:  # numba is optional; pareto_2d_min falls back to numpy
+        return None
+    return njit(cache=True, fastmath=True)(_bnl_2d)
+
+
+def _pareto_2d_min_arr(loads: np.ndarray, costs: np.ndarray) -> np.ndarray:
+    """
+    Frontier indices (int64, ordered by load ascending) for float64 `loads`/`costs`.
+
+    Uses the BNL kernel when numba is available (frontiers are small relative to N,
+    so a single unsorted pass beats sorting everything), else a sort + running minimum.
     """
-    pts = list(enumerate(zip(loads, costs)))
-    # Sort by load ascending, then cost ascending
-    pts.sort(key=lambda t: (t[1][0], t[1][1]))
+    if not len(loads):
+        return np.empty(0, dtype=np.int64)
+
+    bnl = _bnl_2d_jit()
+    if bnl is not None:
+        front = bnl(loads, costs)
+        return front[np.argsort(loads[front], kind="stable")]
+
+    # Sort by load ascending, then cost ascending (lexsort: primary key last)
+    order = np.lexsort((costs, loads))
+    sorted_costs = costs[order]
+    running = np.minimum.accumulate(sorted_costs)
+
+    # A point is on the frontier iff it strictly improves on the best cost so far
+    mask = np.r_[True, sorted_costs[1:] < running[:-1]]
+    return order[mask]
+
+
+@functools.lru_cache(maxsize=8)
+def _pareto_2d_min_cached(loads_key: bytes, costs_key: bytes) -> np.ndarray:
+    # ndarrays aren't hashable, so the cache is keyed on their raw float64 bytes
+    front = _pareto_2d_min_arr(
+        np.frombuffer(loads_key, dtype=np.float64),
+        np.frombuffer(costs_key, dtype=np.float64),
+    )
+    front.flags.writeable = False
+    return front
+
+
+def pareto_2d_min(loads: Sequence[float], costs: Sequence[float]) -> np.ndarray:
+    """
+    Compute indices of the 2D Pareto frontier for minimization in (load, cost).
+    Returns indices of nondominated points, ordered by load ascending.
 
-    frontier: List[int] = []
-    best_cost = float("inf")
-    for idx, (l, c) in pts:
-        if c < best_cost:
-            frontier.append(idx)
-            best_cost = c
-    return frontier
+    Results are memoized on the input values, so re-querying the same antichain
+    (e.g. for several shading modes) doesn't rescan it.
+    """
+    loads = np.ascontiguousarray(loads, dtype=np.float64)
+    costs = np.ascontiguousarray(costs, dtype=np.float64)
+    return _pareto_2d_min_cached(loads.tobytes(), costs.tobytes()).copy()
 
 
 def shade_dominated_region(
     ax,
-    frontier_loads: Sequence[float],
-    frontier_costs: Sequence[float],
+    frontier_loads: np.ndarray,
+    frontier_costs: np.ndarray,
     x_max: float,
     y_max: float,
     label: str,
+    rasterized: bool = False,
 ):
     """
     Shade the region dominated in 2D minimization (top-right of the 2D Pareto front),
     but fill up to plot bounds so the shading stays visible even if the frontier
     is a single point.
+
+    The frontier must be ordered by load ascending (as returned by pareto_2d_min).
     """
-    if not frontier_loads:
+    fx = np.asarray(frontier_loads, dtype=np.float64)
+    fy = np.asarray(frontier_costs, dtype=np.float64)
+    if not len(fx):
         return
 
-    frontier = sorted(zip(frontier_loads, frontier_costs), key=lambda p: p[0])
-    fx = [p[0] for p in frontier]
-    fy = [p[1] for p in frontier]
+    from matplotlib.patches import Rectangle
+
+    style = dict(alpha=0.18, zorder=1, label=label, rasterized=rasterized)
+
+    # Single point: the general polygon below degenerates to this box
+    if len(fx) == 1:
+        ax.add_patch(Rectangle((fx[0], fy[0]), x_max - fx[0], y_max - fy[0], **style))
+        return
 
-    # Fill above the frontier to the top/right plot bounds
-    poly_x = [fx[0]] + fx + [x_max]
-    poly_y = [y_max] + fy + [y_max]
+    # Fill above the frontier out to the top/right plot bounds, closing along
+    # x_max at the last frontier cost so the corner region is covered too
+    poly_x = np.concatenate(([fx[0]], fx, [x_max, x_max]))
+    poly_y = np.concatenate(([y_max], fy, [fy[-1], y_max]))
 
-    ax.fill(poly_x, poly_y, alpha=0.18, zorder=1, label=label)
+    ax.fill(poly_x, poly_y, **style)
 
 
 def parse_args():
@@ -112,30 +268,56 @@ def parse_args():
         choices=["none", "projection", "slice"],
         help="Shading mode for dominated region in 2D (see module docstring).",
     )
-    p.add_argument("--output", default="wildfire_tradespace.png", help="Output PNG")
+    p.add_argument(
+        "--output",
+        default="wildfire_tradespace.png",
+        help="Output image (format from extension, e.g. .png/.pdf/.svg)",
+    )
     p.add_argument(
         "--label-max",
         type=int,
         default=25,
         help="Max number of point labels to draw (to avoid clutter).",
     )
-    return p.parse_args()
+    p.add_argument(
+        "--no-labels",
+        action="store_true",
+        help="Skip point labels entirely (useful for dense tradespaces).",
+    )
+    p.add_argument(
+        "--rasterize",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Rasterize scatter points and shading (keeps axes/labels vector). "
+        "Default: on, except for .pdf/.svg outputs.",
+    )
+    args = p.parse_args()
+    if args.rasterize is None:
+        args.rasterize = not args.output.lower().endswith((".pdf", ".svg"))
+    return args
 
 
 def main():
     args = parse_args()
+
+    import matplotlib
+
+    matplotlib.use("Agg")  # headless: we only ever savefig, skip GUI backend probing
+    import matplotlib.pyplot as plt
+
+    plt.rcParams["path.simplify"] = True
+    plt.rcParams["path.simplify_threshold"] = 1.0
+
     loads, costs, times = load_antichain(args.path, args.which)
 
-    if not loads:
+    if not len(loads):
         raise RuntimeError("No Pareto points found (empty antichain).")
 
     # Optional time slice
     if args.time_max is not None:
-        filtered = [(l, c, t) for (l, c, t) in zip(loads, costs, times) if t <= args.time_max]
-        loads = [x[0] for x in filtered]
-        costs = [x[1] for x in filtered]
-        times = [x[2] for x in filtered]
-        if not loads:
+        keep = times <= args.time_max
+        loads, costs, times = loads[keep], costs[keep], times[keep]
+        if not len(loads):
             raise RuntimeError(f"No points remain after filtering with response_time <= {args.time_max:g} min")
 
     fig, ax = plt.subplots(figsize=(8, 6))
@@ -148,6 +330,7 @@ def main():
         c=times,
         zorder=10,
         label="Pareto points (3D nondominated)",
+        rasterized=args.rasterize,
     )
     cbar = fig.colorbar(sc, ax=ax)
     cbar.set_label("Response time [min]")
@@ -165,24 +348,6 @@ def main():
         label="Utopia (0,0)",
     )
 
-    # Labels: up to N points, evenly spaced
-    n = len(loads)
-    if n <= args.label_max:
-        idxs = range(n)
-    else:
-        step = max(1, n // args.label_max)
-        idxs = range(0, n, step)
-
-    for i in idxs:
-        ax.annotate(
-            f"${int(costs[i]):,}, {int(loads[i])}kg, {int(times[i])}min",
-            xy=(loads[i], costs[i]),
-            xytext=(6, 6),
-            textcoords="offset points",
-            fontsize=9,
-            zorder=11,
-        )
-
     # Axes + title
     ax.set_xlabel("Logistics load [kg]")
     ax.set_ylabel("Total cost [USD]")
@@ -192,11 +357,36 @@ def main():
     ax.set_title(title)
     ax.grid(True, linestyle="--", alpha=0.4)
 
-    # Set limits (used by shading)
-    x_right = max(loads) * 1.05
-    y_top = max(costs) * 1.05
-    ax.set_xlim(left=-0.05 * max(loads), right=x_right)
-    ax.set_ylim(bottom=-0.05 * max(costs), top=y_top)
+    # Set limits (used by labels and shading); loads are sorted ascending by load_antichain
+    load_max = float(loads[-1])
+    cost_max = float(costs.max())
+    x_left, x_right = -0.05 * load_max, load_max * 1.05
+    y_bottom, y_top = -0.05 * cost_max, cost_max * 1.05
+    ax.set(xlim=(x_left, x_right), ylim=(y_bottom, y_top))
+
+    # Labels: up to N points, evenly spaced, skipping any outside the plot bounds
+    if not args.no_labels:
+        n = len(loads)
+        step = 1 if n <= args.label_max else max(1, n // args.label_max)
+        xs, ys, ts = loads[::step], costs[::step], times[::step]
+
+        inside = (xs >= x_left) & (xs <= x_right) & (ys >= y_bottom) & (ys <= y_top)
+        xs, ys, ts = xs[inside], ys[inside], ts[inside]
+
+        # Cast once per column (truncating, like int()) instead of per label
+        xs_i = xs.astype(np.int64).tolist()
+        ys_i = ys.astype(np.int64).tolist()
+        ts_i = ts.astype(np.int64).tolist()
+        texts = [f"${c:,}, {l}kg, {t}min" for l, c, t in zip(xs_i, ys_i, ts_i)]
+        for text, x, y in zip(texts, xs, ys):
+            ax.annotate(
+                text,
+                xy=(x, y),
+                xytext=(6, 6),
+                textcoords="offset points",
+                fontsize=9,
+                zorder=11,
+            )
 
     # Shading (use plot bounds so it stays visible)
     if args.shade != "none":
@@ -204,8 +394,8 @@ def main():
             raise RuntimeError("--shade slice requires --time-max (defines the slice).")
 
         front_idxs = pareto_2d_min(loads, costs)
-        f_loads = [loads[i] for i in front_idxs]
-        f_costs = [costs[i] for i in front_idxs]
+        f_loads = loads[front_idxs]
+        f_costs = costs[front_idxs]
 
         if args.shade == "projection":
             shade_label = "Dominated region (2D projection; ignores time)"
@@ -219,11 +409,12 @@ def main():
             x_max=x_right,
             y_max=y_top,
             label=shade_label,
+            rasterized=args.rasterize,
         )
 
     ax.legend(loc="lower right", framealpha=0.9)
     fig.tight_layout()
-    fig.savefig(args.output, dpi=150)
+    fig.savefig(args.output, dpi=150, bbox_inches="tight")
     print(f"Saved {args.output}")
 
 